@@ -0,0 +1,203 @@
+"""Numeric kernels operating on a face ring given as parallel x and y coordinate buffers.
+
+The kernels are compiled with numba when it is installed and run as plain Python otherwise.
+"""
+from array import array
+from functools import lru_cache
+import math
+from typing import Callable, List, Sequence, Tuple
+
+try:
+    from numba import njit
+    import numpy as np
+
+    HAS_NUMBA = True
+
+    def as_buffer(values: List[float]) -> Sequence[float]:
+        """Converts a list of coordinates into the buffer type expected by the kernels."""
+        return np.asarray(values, dtype=np.float64)
+
+    def as_view(values: array) -> Sequence:
+        """Exposes an ``array.array`` column to the kernels without copying."""
+        return np.frombuffer(values, dtype=values.typecode)
+
+    def new_flags(n: int) -> Sequence[int]:
+        """Allocates a zeroed buffer of ``n`` uint8 flags."""
+        return np.zeros(n, dtype=np.uint8)
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(**kwargs):
+        """No-op stand-in for ``numba.njit`` when numba is not installed."""
+        return lambda func: func
+
+    def as_buffer(values: List[float]) -> Sequence[float]:
+        """Converts a list of coordinates into the buffer type expected by the kernels."""
+        return values
+
+    def as_view(values: array) -> Sequence:
+        """Exposes an ``array.array`` column to the kernels without copying."""
+        return values
+
+    def new_flags(n: int) -> Sequence[int]:
+        """Allocates a zeroed buffer of ``n`` uint8 flags."""
+        return bytearray(n)
+
+
+@njit(cache=True)
+def pseudo_angle(dx: float, dy: float) -> float:
+    """Returns a key in [0, 4) that orders directions like their angle in [0, 2*pi)."""
+    manhattan = abs(dx) + abs(dy)
+    if manhattan == 0:
+        return 0.0
+    key = 1 - dx / manhattan
+    if dy < 0:
+        return 4 - key
+    return key
+
+
+@njit(cache=True)
+def edge_geometry(xs: Sequence[float], ys: Sequence[float], origin: Sequence[int], twin: Sequence[int],
+                  keys: Sequence[float], lengths: Sequence[float]) -> None:
+    """Writes the pseudo-angle and length of every half-edge, given as origin and twin index columns,
+    to ``keys`` and ``lengths``."""
+    for i in range(len(origin)):
+        start, end = origin[i], origin[twin[i]]
+        dx, dy = xs[end] - xs[start], ys[end] - ys[start]
+        keys[i] = pseudo_angle(dx, dy)
+        lengths[i] = math.hypot(dx, dy)
+
+
+@njit(cache=True)
+def shoelace_area(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """Returns the signed area of the ring, positive for counter-clockwise rings."""
+    n = len(xs)
+    total = 0.0
+    x1, y1 = xs[n - 1], ys[n - 1]
+    for i in range(n):
+        x2, y2 = xs[i], ys[i]
+        total += (x1 * y2) - (x2 * y1)
+        x1, y1 = x2, y2
+    return total / 2
+
+
+@njit(cache=True)
+def centroid_xy(xs: Sequence[float], ys: Sequence[float]) -> Tuple[float, float]:
+    """Returns the centroid of the ring, independent of its orientation."""
+    n = len(xs)
+    cx = cy = twice_area = 0.0
+    x1, y1 = xs[n - 1], ys[n - 1]
+    for i in range(n):
+        x2, y2 = xs[i], ys[i]
+        factor = (x1 * y2) - (x2 * y1)
+        twice_area += factor
+        cx += (x1 + x2) * factor
+        cy += (y1 + y2) * factor
+        x1, y1 = x2, y2
+    factor = 1.0 / (3.0 * twice_area)
+    return cx * factor, cy * factor
+
+
+@njit(cache=True)
+def point_in_ring(xs: Sequence[float], ys: Sequence[float], px: float, py: float, tol: float) -> bool:
+    """Determines if the point ``(px, py)`` lies inside or within ``tol`` of the boundary of the ring.
+
+    Boundary hits and the winding number are evaluated in a single pass over the edges.
+    """
+    n = len(xs)
+    winding = 0
+    x1, y1 = xs[n - 1], ys[n - 1]
+    for i in range(n):
+        x2, y2 = xs[i], ys[i]
+        dx, dy = x2 - x1, y2 - y1
+        cross = dx * (py - y1) - (px - x1) * dy
+        if (min(x1, x2) - tol <= px <= max(x1, x2) + tol and min(y1, y2) - tol <= py <= max(y1, y2) + tol
+                and abs(cross) <= tol * math.hypot(dx, dy)):
+            return True
+
+        if y1 <= py:
+            if y2 > py and cross > 0:
+                winding += 1
+        elif y2 <= py and cross < 0:
+            winding -= 1
+        x1, y1 = x2, y2
+    return winding != 0
+
+
+# Rings with more vertices than this use the generic point_in_ring loop
+MAX_UNROLLED_RING = 8
+
+_UNROLLED_EDGE = """
+    dx, dy = x{j} - x{i}, y{j} - y{i}
+    cross = dx * (py - y{i}) - (px - x{i}) * dy
+    if (min(x{i}, x{j}) - tol <= px <= max(x{i}, x{j}) + tol and min(y{i}, y{j}) - tol <= py <= max(y{i}, y{j}) + tol
+            and abs(cross) <= tol * math.hypot(dx, dy)):
+        return True
+    if y{i} <= py:
+        if y{j} > py and cross > 0:
+            winding += 1
+    elif y{j} <= py and cross < 0:
+        winding -= 1
+"""
+
+
+def _unrolled_point_in_ring(n: int) -> Callable[[Sequence[float], Sequence[float], float, float, float], bool]:
+    """Generates a plain Python ``point_in_ring`` with the edge loop unrolled for ``n`` vertices."""
+    names = range(n)
+    source = "def point_in_ring_{n}(xs, ys, px, py, tol):\n".format(n=n)
+    source += "    {}, = xs\n".format(", ".join("x{}".format(i) for i in names))
+    source += "    {}, = ys\n".format(", ".join("y{}".format(i) for i in names))
+    source += "    winding = 0\n"
+    source += "".join(_UNROLLED_EDGE.format(i=(j - 1) % n, j=j) for j in names)
+    source += "    return winding != 0\n"
+
+    namespace = {"math": math}
+    exec(source, namespace)
+    return namespace["point_in_ring_{}".format(n)]
+
+
+@lru_cache(maxsize=None)
+def point_in_ring_for(n: int) -> Callable[[Sequence[float], Sequence[float], float, float, float], bool]:
+    """Returns a ``point_in_ring`` specialised for rings of ``n`` vertices.
+
+    Without numba, small rings get a generated variant with the edge loop fully unrolled. With
+    numba the compiled generic kernel is returned for every size: LLVM already unrolls its loop,
+    and generated functions cannot use the on-disk cache, so each would be JIT-compiled anew in
+    every process.
+    """
+    if HAS_NUMBA or n > MAX_UNROLLED_RING:
+        return point_in_ring
+    return _unrolled_point_in_ring(n)
+
+
+@njit(cache=True)
+def point_on_segment(x1: float, y1: float, x2: float, y2: float, px: float, py: float, tol: float) -> bool:
+    """Determines if the point ``(px, py)`` lies within ``tol`` of the segment from ``(x1, y1)`` to ``(x2, y2)``."""
+    if not (min(x1, x2) - tol <= px <= max(x1, x2) + tol and min(y1, y2) - tol <= py <= max(y1, y2) + tol):
+        return False
+
+    dx, dy = x2 - x1, y2 - y1
+    return abs(dx * (py - y1) - (px - x1) * dy) <= tol * math.hypot(dx, dy)
+
+
+@njit(cache=True)
+def label_cycles(next_: Sequence[int], visited: Sequence[int], labels: Sequence[int], starts: Sequence[int]) -> int:
+    """Labels every cycle of the ``next_`` permutation with consecutive ids.
+
+    Elements are scanned in index order, so cycles are numbered by their smallest element and
+    ``starts`` is increasing. Writes the cycle id of each element to ``labels`` and the first
+    element of each cycle to ``starts``, and returns the number of cycles found.
+    """
+    count = 0
+    for i in range(len(next_)):
+        if visited[i]:
+            continue
+
+        starts[count] = i
+        current = i
+        while not visited[current]:
+            visited[current] = 1
+            labels[current] = count
+            current = next_[current]
+        count += 1
+    return count
@@ -1,9 +1,18 @@
+from array import array
 from typing import List, Tuple
 
+from dcel import _kernels
 from dcel.primitives import Face, HalfEdge
 from dcel.vertex import Vertex
 
 
+def _as_list(values) -> list:
+    """Materialises vertex or edge input, unwrapping array-likes through ``tolist()``."""
+    if hasattr(values, 'tolist'):
+        return values.tolist()
+    return list(values)
+
+
 class Dcel:
     """Represents a Doubly Connected Edge List (DCEL)."""
     def __init__(self, vertices: List[Tuple[float, float]] = None, edges: List[Tuple[int, int]] = None):
@@ -11,8 +20,10 @@ class Dcel:
         self.hedges: List[HalfEdge] = []
         self.faces: List[Face] = []
         
-        if vertices and edges:
-            self.build_dcel(vertices, edges)
+        if vertices is not None and edges is not None:
+            vertices, edges = _as_list(vertices), _as_list(edges)
+            if vertices and edges:
+                self.build_dcel(vertices, edges)
 
     def add_vertex(self, x: float, y: float) -> Vertex:
         """Adds a new vertex to the DCEL."""
@@ -32,6 +43,8 @@ class Dcel:
         
         h1.twin = h2
         h2.twin = h1
+        h1._id = len(self.hedges)
+        h2._id = h1._id + 1
         
         self.hedges.extend([h1, h2])
         v1.hedgelist.append(h1)
@@ -40,60 +53,155 @@ class Dcel:
         return h1, h2
 
     def build_dcel(self, vertices: List[Tuple[float, float]], edges: List[Tuple[int, int]]) -> None:
-        """Constructs the DCEL from vertices and edges."""
-        for x, y in vertices:
-            self.add_vertex(x, y)
+        """Constructs the DCEL from vertices and edges.
+
+        Accepts iterables of tuples or array-likes exposing ``tolist()`` (e.g. NumPy arrays
+        of shape ``(V, 2)`` and ``(E, 2)``), which are converted to plain Python scalars once.
+        """
+        vertices = _as_list(vertices)
+        edges = _as_list(edges)
+
+        offset = len(self.vertices)
+        new_vertices = [Vertex(x, y) for x, y in vertices]
+        for index, vertex in enumerate(new_vertices, offset):
+            vertex._index = index
+        self.vertices.extend(new_vertices)
+
+        vertex_list = self.vertices
+        n_vertices = len(vertex_list)
+        hedge_offset = len(self.hedges)
+        hedges = [None] * (2 * len(edges))
+        # Vertex hedgelists are grown with append on purpose: pre-sizing them from a degree-counting
+        # pass needs a second sweep over the edges plus cursor bookkeeping, which costs more under
+        # CPython than the amortised list growth it avoids
+        for i, (v1_idx, v2_idx) in enumerate(edges):
+            if v1_idx >= n_vertices or v2_idx >= n_vertices:
+                raise ValueError("Vertex index out of range")
 
-        for v1_idx, v2_idx in edges:
-            self.add_edge(v1_idx, v2_idx)
+            v1, v2 = vertex_list[v1_idx], vertex_list[v2_idx]
+            h1 = HalfEdge(v1, v2)
+            h2 = HalfEdge(v2, v1)
+            h1.twin = h2
+            h2.twin = h1
+            h1._id = hedge_offset + 2 * i
+            h2._id = h1._id + 1
+            hedges[2 * i] = h1
+            hedges[2 * i + 1] = h2
+            v1.hedgelist.append(h1)
+            v2.hedgelist.append(h2)
+        self.hedges.extend(hedges)
+
+        # Vertex coordinates as float64 columns indexed by Vertex._index, and half-edge
+        # connectivity as integer columns indexed by HalfEdge._id
+        xs = array('d', [vertex.x for vertex in vertex_list])
+        ys = array('d', [vertex.y for vertex in vertex_list])
+        all_hedges = self.hedges
+        origin = array('q', [hedge.origin._index for hedge in all_hedges])
+        twin = array('q', [hedge.twin._id for hedge in all_hedges])
+        angle_keys = array('d', [0.0]) * len(all_hedges)
+        lengths = array('d', [0.0]) * len(all_hedges)
+        _kernels.edge_geometry(
+            _kernels.as_view(xs),
+            _kernels.as_view(ys),
+            _kernels.as_view(origin),
+            _kernels.as_view(twin),
+            _kernels.as_view(angle_keys),
+            _kernels.as_view(lengths)
+        )
+        for hedge, length in zip(all_hedges, lengths):
+            hedge._length = length
 
         # Sort incident edges and set next/prev pointers
         for vertex in self.vertices:
-            vertex.sortincident()
+            vertex.sortincident(angle_keys)
             for i, hedge in enumerate(vertex.hedgelist):
                 next_idx = (i + 1) % len(vertex.hedgelist)
                 hedge.nexthedge = vertex.hedgelist[next_idx].twin
                 hedge.prevhedge = vertex.hedgelist[i - 1]
 
-        self._create_faces()
+        self._create_faces(array('q', [hedge.nexthedge._id for hedge in all_hedges]))
 
-    def _create_faces(self) -> None:
-        """Creates faces from the DCEL structure."""
-        unprocessed = set(self.hedges)
-        
-        while unprocessed:
-            hedge = unprocessed.pop()
-            if hedge.face is None:
-                face = Face()
-                face.wedge = hedge
-                self.faces.append(face)
-                
-                # Traverse face boundary
-                current = hedge
-                while True:
-                    current.face = face
-                    unprocessed.discard(current)
-                    current = current.nexthedge
-                    if current is hedge:
-                        break
-
-        # Mark external faces using negative area test
+    def _create_faces(self, next_: array) -> None:
+        """Creates faces from the DCEL structure, given the next-edge column indexed by HalfEdge._id.
+
+        Half-edges are visited in allocation order, so faces are numbered by their lowest
+        half-edge id and each face's wedge is that half-edge.
+        """
+        hedges = self.hedges
+        n_hedges = len(hedges)
+        face_of = array('q', [0]) * n_hedges
+        starts = array('q', [0]) * n_hedges
+
+        # Each face is one cycle of the next-edge permutation
+        n_faces = _kernels.label_cycles(
+            _kernels.as_view(next_),
+            _kernels.new_flags(n_hedges),
+            _kernels.as_view(face_of),
+            _kernels.as_view(starts)
+        )
+
+        faces = []
+        for start in starts[:n_faces]:
+            face = Face()
+            face.wedge = hedges[start]
+            faces.append(face)
+
+        # Faces are rebuilt from every cycle, so this replaces any faces of a previous build
+        self.faces = faces
+        for hedge, face_id in zip(hedges, face_of):
+            hedge.face = faces[face_id]
+
+        # Mark external faces using the signed area test: bounded faces are traversed with a
+        # positive signed area, unbounded ones with a negative or zero one
         for face in self.faces:
-            if face.area < 0:
+            if _kernels.shoelace_area(*face._ring) <= 0:
                 face.external = True
 
     @property
     def statistics(self) -> dict:
         """Returns basic statistics about the DCEL."""
+        internal_faces = 0
+        total_perimeter = 0.0
+        total_area = 0.0
+        for face in self.faces:
+            if face.external:
+                continue
+            internal_faces += 1
+            total_perimeter += face.perimeter
+            total_area += face.area
+
         return {
             'vertices': len(self.vertices),
             'edges': len(self.hedges) // 2,
             'faces': len(self.faces),
-            'internal_faces': sum(1 for f in self.faces if not f.external),
-            'total_perimeter': sum(f.perimeter for f in self.faces if not f.external),
-            'total_area': sum(f.area for f in self.faces if not f.external)
+            'internal_faces': internal_faces,
+            'total_perimeter': total_perimeter,
+            'total_area': total_area
         }
 
+    def to_shapely(self) -> list:
+        """Returns the internal faces as shapely Polygons.
+
+        Requires the optional ``shapely`` package. With shapely 2.0 all rings are built in one
+        vectorized call. Faces with fewer than three vertices cannot form a polygon and are skipped.
+        """
+        import shapely
+
+        faces = [face for face in self.faces if not face.external and face.vertex_count >= 3]
+        if not faces:
+            return []
+
+        if not hasattr(shapely, 'linearrings'):
+            # shapely < 2.0 has no vectorized constructors
+            from shapely.geometry import Polygon
+            return [Polygon(list(zip(*face._coords()))) for face in faces]
+
+        import numpy as np
+
+        coords = [coord for face in faces for coord in zip(*face._coords())]
+        indices = np.repeat(np.arange(len(faces)), [face.vertex_count for face in faces])
+        return list(shapely.polygons(shapely.linearrings(coords, indices=indices)))
+
     def __repr__(self) -> str:
         stats = self.statistics
         return f"DCEL(vertices={stats['vertices']}, edges={stats['edges']}, faces={stats['faces']})"
@@ -1,21 +1,33 @@
-from dataclasses import dataclass
 import math
 
 
-@dataclass
 class Point:
     """Represents a 2D point with x and y coordinates"""
-    x: float
-    y: float
-    
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+
     def __add__(self, other: 'Point') -> 'Point':
         return Point(self.x + other.x, self.y + other.y)
-    
+
     def __sub__(self, other: 'Point') -> 'Point':
         return Point(self.x - other.x, self.y - other.y)
-    
+
     def __mul__(self, scalar: float) -> 'Point':
         return Point(self.x * scalar, self.y * scalar)
-    
+
     def distance_to(self, other: 'Point') -> float:
-        return math.sqrt((self.x - other.x)**2 + (self.y - other.y)**2)
+        return math.hypot(self.x - other.x, self.y - other.y)
+
+    def __repr__(self) -> str:
+        return f"Point(x={self.x!r}, y={self.y!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    # Points are mutable, so they are not hashable
+    __hash__ = None
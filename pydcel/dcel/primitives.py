@@ -1,39 +1,65 @@
-from functools import cached_property
 import math
-from typing import Iterator, Optional, Tuple
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
 
+from dcel import _kernels
 from dcel.point import Point
-from dcel.utils import signed_area
 from dcel.vertex import Vertex
 
 
+# Boundary tolerance of point queries, relative to the extent of the face
+EPSILON = 1e-10
+
+
+class _fastcache:
+    """Lock-free replacement for ``functools.cached_property``.
+
+    Stores the computed value in the instance ``__dict__`` under the same name, so later
+    reads bypass the descriptor entirely.
+    """
+    def __init__(self, func: Callable[[Any], Any]):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.func(instance)
+        return value
+
+
 class HalfEdge:
     """Represents a half-edge (directed edge) in the DCEL."""
+    __slots__ = ('origin', 'twin', 'face', 'nexthedge', 'prevhedge', 'destination', '_id', '_length', '_angle')
+
     def __init__(self, v1: Vertex, v2: Vertex):
         self.origin = v1
         self.twin: Optional[HalfEdge] = None
         self.face: Optional['Face'] = None
         self.nexthedge: Optional[HalfEdge] = None
         self.prevhedge: Optional[HalfEdge] = None
-        self._destination = v2
+        self.destination = v2
+        self._id: Optional[int] = None
+        self._length: Optional[float] = None
+        self._angle: Optional[float] = None
 
     @property
-    def destination(self) -> Vertex:
-        """Returns the destination vertex of the half-edge"""
-        return self.twin.origin if self.twin else self._destination
-
-    @cached_property
     def length(self) -> float:
         """Computes and caches the length of the edge."""
-        return self.origin._point.distance_to(self.destination._point)
+        if self._length is None:
+            destination = self.destination
+            self._length = math.hypot(destination.x - self.origin.x, destination.y - self.origin.y)
+        return self._length
 
-    @cached_property
+    @property
     def angle(self) -> float:
         """Computes and caches the angle of the edge with respect to the x-axis."""
-        dx = self.destination.x - self.origin.x
-        dy = self.destination.y - self.origin.y
-        angle = math.atan2(dy, dx)
-        return angle if angle >= 0 else angle + 2 * math.pi
+        if self._angle is None:
+            dx = self.destination.x - self.origin.x
+            dy = self.destination.y - self.origin.y
+            angle = math.atan2(dy, dx)
+            self._angle = angle if angle >= 0 else angle + 2 * math.pi
+        return self._angle
 
     @property
     def midpoint(self) -> Point:
@@ -49,128 +75,115 @@ class HalfEdge:
 
 class Face:
     """Represents a face (polygon) in the DCEL."""
+    # __dict__ is kept as the storage for the _fastcache properties
+    __slots__ = ('wedge', 'external', '_edge_cycle', '__dict__')
+
     def __init__(self):
         self.wedge: Optional[HalfEdge] = None
         self.external: bool = False
-        self._cached_properties = {}
+        self._edge_cycle: Optional[Tuple[HalfEdge, ...]] = None
 
-    @cached_property
+    @_fastcache
     def area(self) -> float:
-        """Calculates the signed area of the polygon."""
+        """Calculates the area of the polygon using the shoelace formula."""
         if not self.wedge:
             return 0.0
-            
-        area = 0.0
-        for v1, v2 in self.edge_vertices():
-            area += (v1.x * v2.y) - (v2.x * v1.y)
-        return abs(area) / 2
 
-    @cached_property
+        return abs(_kernels.shoelace_area(*self._ring))
+
+    @_fastcache
     def perimeter(self) -> float:
-        """Calculates the perimeter of the polygon."""
-        return sum(edge.length for edge in self.edges())
+        """Calculates the perimeter of the polygon from its (cached) edge lengths."""
+        if not self.wedge:
+            return 0.0
+
+        return sum(edge.length for edge in self._edges)
 
-    @cached_property
+    @_fastcache
     def centroid(self) -> Point:
         """Calculates the centroid (center of mass) of the polygon."""
         if not self.wedge:
             raise ValueError("Face has no edges")
-            
-        area = self.area
-        if area == 0:
+
+        if self.area == 0:
             raise ValueError("Face has zero area")
 
-        cx = cy = 0.0
-        for v1, v2 in self.edge_vertices():
-            factor = (v1.x * v2.y) - (v2.x * v1.y)
-            cx += (v1.x + v2.x) * factor
-            cy += (v1.y + v2.y) * factor
+        return Point(*_kernels.centroid_xy(*self._ring))
 
-        factor = 1.0 / (6.0 * area)
-        return Point(cx * factor, cy * factor)
+    @_fastcache
+    def _ring(self) -> Tuple[Sequence[float], Sequence[float]]:
+        """Caches the vertex coordinates in the buffer type used by the numeric kernels."""
+        xs, ys = self._coords()
+        return _kernels.as_buffer(xs), _kernels.as_buffer(ys)
 
-    def vertices(self) -> Iterator[Vertex]:
-        """Yields vertices of the face in counter-clockwise order."""
+    def _coords(self) -> Tuple[List[float], List[float]]:
+        """Returns the x and y coordinates of the face's vertices in traversal order."""
+        origins = [edge.origin for edge in self._edges]
+        return [vertex.x for vertex in origins], [vertex.y for vertex in origins]
+
+    @property
+    def _edges(self) -> Tuple[HalfEdge, ...]:
+        """Walks the boundary once and caches its half-edges in counter-clockwise order.
+
+        Nothing is cached while the face has no wedge, so it can still be linked afterwards.
+        """
+        if self._edge_cycle is not None:
+            return self._edge_cycle
         if not self.wedge:
-            return
-        
+            return ()
+
+        edges = []
         start = self.wedge
         current = start
         while True:
-            yield current.origin
+            edges.append(current)
             current = current.nexthedge
             if current is start:
                 break
+        self._edge_cycle = tuple(edges)
+        return self._edge_cycle
+
+    def vertices(self) -> Iterator[Vertex]:
+        """Yields vertices of the face in counter-clockwise order."""
+        return (edge.origin for edge in self._edges)
 
     def edges(self) -> Iterator[HalfEdge]:
         """Yields half-edges of the face in counter-clockwise order."""
-        if not self.wedge:
-            return
-            
-        start = self.wedge
-        current = start
-        while True:
-            yield current
-            current = current.nexthedge
-            if current is start:
-                break
+        return iter(self._edges)
 
     def edge_vertices(self) -> Iterator[Tuple[Vertex, Vertex]]:
         """Yields pairs of vertices forming edges."""
-        for edge in self.edges():
-            yield edge.origin, edge.destination
+        return ((edge.origin, edge.destination) for edge in self._edges)
 
     def isinside(self, point: Tuple[float, float]) -> bool:
         """Determines if a point is inside the face using the winding number algorithm.
         Also handles points exactly on edges or vertices."""
-        
-        for edge in self.edges():
-            if (point[0] == edge.origin.x and point[1] == edge.origin.y) or \
-            (point[0] == edge.destination.x and point[1] == edge.destination.y):
-                return True
-                
-            if self._point_on_edge(point, edge):
-                return True
-        
-        # Not on boundary: use winding number algorithm
-        winding_number = 0
-        for v1, v2 in self.edge_vertices():
-            if v1.y <= point[1]:
-                if v2.y > point[1]:
-                    if signed_area((v1.x, v1.y), (v2.x, v2.y), point) > 0:
-                        winding_number += 1
-            else:
-                if v2.y <= point[1]:
-                    if signed_area((v1.x, v1.y), (v2.x, v2.y), point) < 0:
-                        winding_number -= 1
-        return winding_number != 0
+        if not self.wedge:
+            return False
+
+        point_in_ring = _kernels.point_in_ring_for(len(self._edges))
+        return point_in_ring(*self._ring, point[0], point[1], self._tolerance)
 
     def _point_on_edge(self, point: Tuple[float, float], edge: HalfEdge) -> bool:
-        """Helper method to determine if a point lies exactly on an edge."""
+        """Helper method to determine if a point lies on an edge, up to the face tolerance."""
+        origin, destination = edge.origin, edge.destination
+        return _kernels.point_on_segment(
+            origin.x, origin.y, destination.x, destination.y, point[0], point[1], self._tolerance
+        )
 
-        x_min = min(edge.origin.x, edge.destination.x)
-        x_max = max(edge.origin.x, edge.destination.x)
-        y_min = min(edge.origin.y, edge.destination.y)
-        y_max = max(edge.origin.y, edge.destination.y)
-        
-        
-        if not (x_min <= point[0] <= x_max and y_min <= point[1] <= y_max):
-            return False
-        
-        if edge.origin.x == edge.destination.x:
-            return point[0] == edge.origin.x
-            
-        if edge.origin.y == edge.destination.y:
-            return point[1] == edge.origin.y
-        
-        slope = (edge.destination.y - edge.origin.y) / (edge.destination.x - edge.origin.x)
-        expected_y = edge.origin.y + slope * (point[0] - edge.origin.x)
-        return abs(expected_y - point[1]) < 1e-10
+    @_fastcache
+    def _tolerance(self) -> float:
+        """Scales EPSILON by the bounding box diagonal of the face, but never below EPSILON."""
+        if not self.wedge:
+            return EPSILON
+
+        xs, ys = self._ring
+        return EPSILON * max(math.hypot(max(xs) - min(xs), max(ys) - min(ys)), 1.0)
 
     @property
     def vertex_count(self) -> int:
         """Returns the number of vertices in the face."""
-        return sum(1 for _ in self.vertices())
+        return len(self._edges)
 
     def __repr__(self) -> str:
         return f"Face(external={self.external}, vertices={self.vertex_count})"
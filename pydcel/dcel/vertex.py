@@ -1,22 +1,28 @@
-from typing import List, Tuple, Optional, Iterator
+from typing import List, Tuple, Optional, Iterator, Sequence
 
+from dcel._kernels import pseudo_angle
 from dcel.point import Point
 
 
 class Vertex:
-    """Represents a vertex in a DCEL with its coordinates and incident half-edges."""
+    """Represents a vertex in a DCEL with its coordinates and incident half-edges.
+
+    The coordinates are plain attributes. ``Dcel.build_dcel`` reads them afresh on every call,
+    but editing them afterwards does not invalidate the cached half-edge lengths or face
+    geometry, so move vertices before building the topology.
+    """
+    __slots__ = ('x', 'y', 'hedgelist', '_index')
+
     def __init__(self, x: float, y: float):
-        self._point = Point(x, y)
+        self.x = x
+        self.y = y
         self.hedgelist = []
         self._index: Optional[int] = None
 
     @property
-    def x(self) -> float:
-        return self._point.x
-
-    @property
-    def y(self) -> float:
-        return self._point.y
+    def _point(self) -> Point:
+        """Returns the coordinates of the vertex as a Point."""
+        return Point(self.x, self.y)
 
     @property
     def coordinates(self) -> Tuple[float, float]:
@@ -27,9 +33,18 @@ class Vertex:
         """Returns the degree (number of incident edges) of the vertex"""
         return len(self.hedgelist)
 
-    def sortincident(self) -> None:
-        """Sorts incident edges counter-clockwise based on their angles."""
-        self.hedgelist.sort(key=lambda h: h.angle, reverse=True)
+    def sortincident(self, keys: Optional[Sequence[float]] = None) -> None:
+        """Sorts incident edges counter-clockwise based on their angles.
+
+        ``keys`` optionally holds precomputed pseudo-angles indexed by ``HalfEdge._id``.
+        """
+        if keys is None:
+            self.hedgelist.sort(
+                key=lambda h: pseudo_angle(h.destination.x - h.origin.x, h.destination.y - h.origin.y),
+                reverse=True
+            )
+        else:
+            self.hedgelist.sort(key=lambda h: keys[h._id], reverse=True)
 
     def __repr__(self) -> str:
         return f"Vertex({self.x}, {self.y})"
@@ -6,6 +6,8 @@ from typing import List
 from dcel.point import Point
 from dcel.vertex import Vertex
 from dcel.primitives import Face, HalfEdge
+from dcel.dcel import Dcel
+from dcel import _kernels
 
 # -------------------- Point Tests --------------------
 class TestPoint:
@@ -69,6 +71,19 @@ class TestPoint:
         """Tests specific distance calculations with known results."""
         assert isclose(p1.distance_to(p2), expected_dist)
 
+# -------------------- Vertex Tests --------------------
+class TestVertex:
+    def test_sortincident_order(self):
+        """Test that incident edges are sorted by decreasing angle"""
+        center = Vertex(0, 0)
+        targets = [(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1), (2, -3)]
+        for x, y in targets:
+            center.hedgelist.append(HalfEdge(center, Vertex(x, y)))
+
+        center.sortincident()
+        angles = [hedge.angle for hedge in center.hedgelist]
+        assert angles == sorted(angles, reverse=True)
+
 # -------------------- Half Edge Tests --------------------
 class TestHalfEdge:
     @pytest.fixture
@@ -195,6 +210,19 @@ class TestFace:
         with pytest.raises(ValueError):
             _ = face.centroid
 
+    def test_wedge_set_after_inspection(self):
+        """Test that inspecting a face before its wedge is set does not cache an empty boundary"""
+        vertices = [Vertex(0, 0), Vertex(1, 0), Vertex(0, 1)]
+        edges = [HalfEdge(vertices[i], vertices[(i+1)%3]) for i in range(3)]
+        for i in range(3):
+            edges[i].nexthedge = edges[(i+1)%3]
+
+        face = Face()
+        repr(face)
+        face.wedge = edges[0]
+        assert face.vertex_count == 3
+        assert isclose(face.area, 0.5, rel_tol=1e-10)
+
     def test_square_properties(self, square_face):
         """Test properties of a square face"""
         assert isclose(square_face.area, 1.0, rel_tol=1e-10)
@@ -206,6 +234,19 @@ class TestFace:
         assert isclose(centroid.x, 0.5, rel_tol=1e-10)
         assert isclose(centroid.y, 0.5, rel_tol=1e-10)
 
+    def test_clockwise_square_properties(self):
+        """Test that area and centroid do not depend on the traversal orientation"""
+        vertices = [Vertex(0, 0), Vertex(0, 1), Vertex(1, 1), Vertex(1, 0)]
+        edges = [HalfEdge(vertices[i], vertices[(i+1)%4]) for i in range(4)]
+        for i in range(4):
+            edges[i].nexthedge = edges[(i+1)%4]
+
+        face = Face()
+        face.wedge = edges[0]
+        assert isclose(face.area, 1.0, rel_tol=1e-10)
+        assert isclose(face.centroid.x, 0.5, rel_tol=1e-10)
+        assert isclose(face.centroid.y, 0.5, rel_tol=1e-10)
+
     def test_triangle_properties(self, triangle_face):
         """Test properties of a triangle face"""
         assert isclose(triangle_face.area, 0.5, rel_tol=1e-10)
@@ -224,6 +265,33 @@ class TestFace:
         """Test point-in-polygon tests"""
         assert square_face.isinside(point) == expected_inside
 
+    def test_point_on_edge_tolerance(self):
+        """Test that boundary points off by floating-point rounding still count as inside"""
+        vertices = [Vertex(0, 0), Vertex(0.3, 0), Vertex(0.3, 0.3), Vertex(0, 0.3)]
+        edges = [HalfEdge(vertices[i], vertices[(i+1)%4]) for i in range(4)]
+        for i in range(4):
+            edges[i].nexthedge = edges[(i+1)%4]
+
+        face = Face()
+        face.wedge = edges[0]
+        assert 0.1 + 0.2 > 0.3
+        assert face.isinside((0.1 + 0.2, 0.15))
+        assert face._point_on_edge((0.1 + 0.2, 0.15), edges[1])
+        assert not face.isinside((0.3 + 1e-6, 0.15))
+
+    @pytest.mark.parametrize("n", [3, 4, 5, 8, 9])
+    def test_specialised_point_in_ring(self, n):
+        """Test that the unrolled point-in-ring kernels agree with the generic loop"""
+        xs = _kernels.as_buffer([math.cos(2 * pi * i / n) for i in range(n)])
+        ys = _kernels.as_buffer([math.sin(2 * pi * i / n) for i in range(n)])
+        specialised = _kernels._unrolled_point_in_ring(n)
+        for px in (-1.2, -0.7, -0.1, 0.0, 0.5, 1.0, 1.1):
+            for py in (-1.0, -0.3, 0.0, 0.2, 0.9):
+                assert specialised(xs, ys, px, py, 1e-10) == _kernels.point_in_ring(xs, ys, px, py, 1e-10)
+
+        if _kernels.HAS_NUMBA or n > _kernels.MAX_UNROLLED_RING:
+            assert _kernels.point_in_ring_for(n) is _kernels.point_in_ring
+
     def test_vertex_iteration(self, square_face):
         """Test vertex iteration"""
         vertices = list(square_face.vertices())
@@ -258,6 +326,108 @@ class TestFace:
             assert v1.coordinates == exp1
             assert v2.coordinates == exp2
 
+# -------------------- DCEL Tests --------------------
+class TestDcel:
+    @pytest.fixture
+    def split_square(self):
+        """Creates a unit square split into two triangles by the diagonal (0,0)-(1,1)"""
+        vertices = [(0, 0), (1, 0), (1, 1), (0, 1)]
+        edges = [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)]
+        return Dcel(vertices, edges)
+
+    def test_build_counts(self, split_square):
+        """Test vertex, edge and face counts after construction"""
+        stats = split_square.statistics
+        assert stats['vertices'] == 4
+        assert stats['edges'] == 5
+        assert stats['faces'] == 3
+        assert stats['internal_faces'] == 2
+        assert isclose(stats['total_area'], 1.0, rel_tol=1e-10)
+        assert isclose(stats['total_perimeter'], 4 + 2 * sqrt(2), rel_tol=1e-10)
+        assert len(split_square.hedges) == 10
+
+    def test_build_topology(self, split_square):
+        """Test twin/next/prev consistency and vertex indexing"""
+        for i, vertex in enumerate(split_square.vertices):
+            assert vertex._index == i
+        for hedge in split_square.hedges:
+            assert hedge.twin.twin is hedge
+            assert hedge.origin is hedge.twin.destination
+            assert hedge.face is not None
+            assert split_square.hedges[hedge._id] is hedge
+            assert hedge.face in split_square.faces
+            assert isclose(hedge.length, hedge.origin._point.distance_to(hedge.destination._point))
+        assert sum(face.vertex_count for face in split_square.faces) == len(split_square.hedges)
+
+    def test_face_order(self, split_square):
+        """Test that faces are discovered in half-edge allocation order"""
+        wedge_ids = [face.wedge._id for face in split_square.faces]
+        assert wedge_ids == sorted(wedge_ids)
+        assert wedge_ids[0] == 0
+        for face in split_square.faces:
+            assert face.wedge._id == min(edge._id for edge in face.edges())
+
+    def test_build_from_array_like(self, split_square):
+        """Test that inputs exposing tolist() are accepted"""
+        class ArrayLike(list):
+            def tolist(self):
+                return list(self)
+
+        dcel = Dcel(ArrayLike([(0, 0), (1, 0), (1, 1), (0, 1)]),
+                    ArrayLike([(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)]))
+        assert dcel.statistics == split_square.statistics
+
+    def test_build_from_generators(self, split_square):
+        """Test that one-shot iterables are accepted by the constructor"""
+        vertices = ((x, y) for x, y in [(0, 0), (1, 0), (1, 1), (0, 1)])
+        edges = ((a, b) for a, b in [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)])
+        dcel = Dcel(vertices, edges)
+        assert dcel.statistics == split_square.statistics
+
+    def test_build_from_iterator(self, split_square):
+        """Test that build_dcel reads a vertex iterator only once"""
+        dcel = Dcel()
+        dcel.build_dcel(iter([(0, 0), (1, 0), (1, 1), (0, 1)]), [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)])
+        assert dcel.statistics == split_square.statistics
+        assert isclose(sum(face.perimeter for face in dcel.faces if not face.external), 4 + 2 * sqrt(2))
+
+    def test_build_after_moving_vertex(self):
+        """Test that build_dcel uses the current vertex coordinates"""
+        dcel = Dcel()
+        for x, y in [(0, 0), (1, 0), (1, 1), (0, 1)]:
+            dcel.add_vertex(x, y)
+        dcel.vertices[2].x = 2
+        dcel.build_dcel([], [(0, 1), (1, 2), (2, 3), (3, 0)])
+        internal = [face for face in dcel.faces if not face.external]
+        assert len(internal) == 1
+        assert isclose(internal[0].area, 1.5, rel_tol=1e-10)
+        assert isclose(internal[0].perimeter, 4 + sqrt(2), rel_tol=1e-10)
+
+    def test_to_shapely(self, split_square):
+        """Test export of the faces to shapely polygons"""
+        pytest.importorskip("shapely")
+        polygons = split_square.to_shapely()
+        internal = [face for face in split_square.faces if not face.external]
+        assert len(polygons) == 2
+        assert isclose(sum(polygon.area for polygon in polygons), 1.0, rel_tol=1e-10)
+        for polygon, face in zip(polygons, internal):
+            assert polygon.is_valid
+            assert isclose(polygon.area, face.area, rel_tol=1e-10)
+            assert isclose(polygon.length, face.perimeter, rel_tol=1e-10)
+
+    def test_collinear_face(self):
+        """Test that a face enclosing no area reports zero area and has no centroid"""
+        dcel = Dcel([(0.1, 0.7), (0.3, 1.3), (0.9, 3.1), (1.7, 5.5)], [(0, 1), (1, 2), (2, 3)])
+        for face in dcel.faces:
+            assert face.area == 0.0
+            with pytest.raises(ValueError):
+                _ = face.centroid
+
+    def test_invalid_edge_index(self):
+        """Test that edges referencing missing vertices are rejected"""
+        with pytest.raises(ValueError):
+            Dcel([(0, 0), (1, 0)], [(0, 2)])
+
 
 if __name__ == "__main__":
     pytest.main([__file__])